@@ -12,7 +12,15 @@ class Database:
     def initialize(cls, database_url: str, echo: bool = False):
         """Initialize the async engine and sessionmaker."""
         if cls._engine is None:  # Ensure engine is created once
-            cls._engine = create_async_engine(database_url, echo=echo, future=True)
+            cls._engine = create_async_engine(
+                database_url,
+                echo=echo,
+                future=True,
+                pool_size=20,
+                max_overflow=10,
+                pool_timeout=30,
+                pool_pre_ping=True,
+            )
             cls._session_factory = sessionmaker(
                 bind=cls._engine, class_=AsyncSession, expire_on_commit=False, future=True
             )
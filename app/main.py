@@ -1,5 +1,6 @@
 from fastapi import FastAPI
-from starlette.responses import JSONResponse
+from fastapi.responses import ORJSONResponse
+from starlette.responses import Response
 from app.database import Database
 from app.dependencies import get_settings
 from app.routers import user_routes
@@ -22,12 +23,17 @@ app = FastAPI(
         "email": "support@example.com",
     },
     license_info={"name": "MIT", "url": "https://opensource.org/licenses/MIT"},
-    lifespan=lifespan  # ✅ correctly passed
+    lifespan=lifespan,  # ✅ correctly passed
+    default_response_class=ORJSONResponse,
 )
 
+# The generic 500 body is constant, so serialize it once instead of running
+# json.dumps on every failed request.
+_ERR_BYTES = b'{"message":"An unexpected error occurred."}'
+
 @app.exception_handler(Exception)
 async def exception_handler(request, exc):
-    return JSONResponse(status_code=500, content={"message": "An unexpected error occurred."})
+    return Response(content=_ERR_BYTES, status_code=500, media_type="application/json")
 
 app.include_router(user_routes.router)  # ✅ router is included
 
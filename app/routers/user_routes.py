@@ -58,7 +58,7 @@ async def get_user(user_id: UUID, request: Request, db: AsyncSession = Depends(g
         raise HTTPException(status_code=status.HTTP_404_NOT_FOUND, detail="User not found")
 
     return UserResponse.model_construct(
-        id=user.id,
+        id=str(user.id),
         nickname=user.nickname,
         first_name=user.first_name,
         last_name=user.last_name,
@@ -95,7 +95,7 @@ async def update_user(user_id: UUID, user_update: UserUpdate, request: Request,
         raise HTTPException(status_code=status.HTTP_404_NOT_FOUND, detail="User not found")
 
     return UserResponse.model_construct(
-        id=updated_user.id,
+        id=str(updated_user.id),
         bio=updated_user.bio,
         first_name=updated_user.first_name,
         last_name=updated_user.last_name,
@@ -152,7 +152,7 @@ async def create_user(user: UserCreate, request: Request, db: AsyncSession = Dep
     
     
     return UserResponse.model_construct(
-        id=created_user.id,
+        id=str(created_user.id),
         bio=created_user.bio,
         first_name=created_user.first_name,
         last_name=created_user.last_name,
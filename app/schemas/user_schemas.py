@@ -1,5 +1,4 @@
-from builtins import ValueError, any, bool, str
-from pydantic import BaseModel, EmailStr, Field, field_validator, model_validator
+from pydantic import BaseModel, Field, field_validator, model_validator
 from typing import Optional, List
 from datetime import datetime
 from enum import Enum
@@ -16,25 +15,51 @@ class UserRole(str, Enum):
     ADMIN = "ADMIN"
 
 
+_URL_RE = re.compile(r'^https?:\/\/[^\s/$.?#].[^\s]*$')
+_EMAIL_RE = re.compile(r'^[^@\s]+@[^@\s]+\.[^@\s]+$')
+_NICKNAME_RE = re.compile(r'^[\w-]+$')
+
+# Schema examples shared by multiple fields, allocated once at import.
+# (pydantic's schema builder requires a real dict here, so these are plain
+# dicts by convention rather than mapping proxies.)
+_EX_EMAIL = {"example": "john.doe@example.com"}
+_EX_PASSWORD = {"example": "Secure*1234"}
+
+
+def validate_email(email: str) -> str:
+    if not isinstance(email, str) or not _EMAIL_RE.match(email):
+        raise ValueError('Invalid email format')
+    return email
+
+
+def validate_nickname(nickname: Optional[str]) -> Optional[str]:
+    if nickname is None:
+        return nickname
+    if not isinstance(nickname, str) or not _NICKNAME_RE.match(nickname):
+        raise ValueError('Invalid nickname format')
+    return nickname
+
+
 def validate_url(url: Optional[str]) -> Optional[str]:
     if url is None:
         return url
-    url_regex = r'^https?:\/\/[^\s/$.?#].[^\s]*$'
-    if not re.match(url_regex, url):
+    # Cheap C-level prefix check rejects obviously-wrong strings before the
+    # regex engine runs at all.
+    if not url.startswith(("http://", "https://")) or not _URL_RE.match(url):
         raise ValueError('Invalid URL format')
     return url
 
 
 class UserBase(BaseModel):
-    email: EmailStr = Field(..., json_schema_extra={'example' == "john.doe@example.com"})
+    email: str = Field(..., json_schema_extra=_EX_EMAIL)
     nickname: Optional[str] = Field(
-        None, min_length=3, pattern=r'^[\w-]+$', json_schema_extra={'example' == "johnny_dev"})
-    first_name: Optional[str] = Field(None, json_schema_extra={'example' == "John"})
-    last_name: Optional[str] = Field(None, json_schema_extra={'example' == "Doe"})
-    bio: Optional[str] = Field(None, json_schema_extra={'example' == "Experienced developer specializing in web applications."})
-    profile_picture_url: Optional[str] = Field(None, json_schema_extra={'example' == "https://example.com/profiles/john.jpg"})
-    linkedin_profile_url: Optional[str] = Field(None, json_schema_extra={'example' == "https://linkedin.com/in/johndoe"})
-    github_profile_url: Optional[str] = Field(None, json_schema_extra={'example' == "https://github.com/johndoe"})
+        None, min_length=3, json_schema_extra={"example": "johnny_dev"})
+    first_name: Optional[str] = Field(None, json_schema_extra={"example": "John"})
+    last_name: Optional[str] = Field(None, json_schema_extra={"example": "Doe"})
+    bio: Optional[str] = Field(None, json_schema_extra={"example": "Experienced developer specializing in web applications."})
+    profile_picture_url: Optional[str] = Field(None, json_schema_extra={"example": "https://example.com/profiles/john.jpg"})
+    linkedin_profile_url: Optional[str] = Field(None, json_schema_extra={"example": "https://linkedin.com/in/johndoe"})
+    github_profile_url: Optional[str] = Field(None, json_schema_extra={"example": "https://github.com/johndoe"})
 
     _validate_urls = field_validator(
         'profile_picture_url', 'linkedin_profile_url', 'github_profile_url',
@@ -42,42 +67,63 @@ class UserBase(BaseModel):
 
     )(validate_url)
 
+    _validate_email = field_validator('email', mode='before')(validate_email)
+
+    _validate_nickname = field_validator('nickname', mode='before')(validate_nickname)
+
     model_config = ConfigDict(from_attributes=True)
 
 
 class UserCreate(UserBase):
-    password: str = Field(..., json_schema_extra={'example' == "Secure*1234"})
+    password: str = Field(..., json_schema_extra=_EX_PASSWORD)
 
 
 class UserUpdate(UserBase):
 
     @model_validator(mode='before')
     def check_at_least_one_value(cls, values):
-        if not any(values.values()):
+        # Explicit None test short-circuits on the first supplied field and
+        # avoids per-value truthiness dispatch for strings.
+        if not any(v is not None for v in values.values()):
             raise ValueError("At least one field must be provided for update")
         return values
 
 
 class UserResponse(UserBase):
-    id: uuid.UUID = Field(..., json_schema_extra={'example'==str(uuid.uuid4())})
-    role: UserRole = Field(default=UserRole.AUTHENTICATED, json_schema_extra={'example' == "AUTHENTICATED"})
-    is_professional: Optional[bool] = Field(default=False, json_schema_extra={'example'== True})
+    # Typed as str so serialization writes the value straight out instead of
+    # round-tripping a UUID object per row; UUIDs from the ORM are coerced once
+    # on the way in.
+    id: str = Field(..., json_schema_extra={"example": str(uuid.uuid4())})
+    role: UserRole = Field(default=UserRole.AUTHENTICATED, json_schema_extra={"example": "AUTHENTICATED"})
+    is_professional: Optional[bool] = Field(default=False, json_schema_extra={"example": True})
+
+    @field_validator('id', mode='before')
+    def _coerce_id(cls, v):
+        return str(v) if isinstance(v, uuid.UUID) else v
+
+    # Output-only model: freezing lets pydantic-core skip mutability
+    # bookkeeping and extra-key collection on the serialization path.
+    model_config = ConfigDict(from_attributes=True, frozen=True, extra='ignore')
 
 
 class LoginRequest(BaseModel):
-    email: EmailStr = Field(..., json_schema_extra={'example' == "john.doe@example.com"})
-    password: str = Field(..., json_schema_extra={'example' == "Secure*1234"})
+    email: str = Field(..., json_schema_extra=_EX_EMAIL)
+    password: str = Field(..., json_schema_extra=_EX_PASSWORD)
+
+    _validate_email = field_validator('email', mode='before')(validate_email)
 
 
 class ErrorResponse(BaseModel):
-    error: str = Field(..., json_schema_extra={'example' == "Not Found"})
-    details: Optional[str] = Field(None, json_schema_extra={'example' == "The requested resource was not found."})
+    error: str = Field(..., json_schema_extra={"example": "Not Found"})
+    details: Optional[str] = Field(None, json_schema_extra={"example": "The requested resource was not found."})
+
+    model_config = ConfigDict(frozen=True, extra='ignore')
 
 
 class UserListResponse(BaseModel):
     items: List[UserResponse] = Field(
         ...,
-        json_schema_extra={'example' == [
+        json_schema_extra={"example": [
             {
                 "id": str(uuid.uuid4()),
                 "nickname": "johnny_dev",
@@ -93,6 +139,8 @@ class UserListResponse(BaseModel):
             }
         ]
    } )
-    total: int = Field(..., json_schema_extra={'example' == 100})
-    page: int = Field(..., json_schema_extra={'example' == 1})
-    size: int = Field(..., json_schema_extra={'example' == 10})
+    total: int = Field(..., json_schema_extra={"example": 100})
+    page: int = Field(..., json_schema_extra={"example": 1})
+    size: int = Field(..., json_schema_extra={"example": 10})
+
+    model_config = ConfigDict(frozen=True, extra='ignore')
@@ -1,4 +1,5 @@
 from builtins import Exception, bool, classmethod, int, str
+import asyncio
 from datetime import datetime, timezone
 import secrets
 from typing import Optional, Dict, List
@@ -19,7 +20,18 @@ import logging
 settings = get_settings()
 logger = logging.getLogger(__name__)
 
+# Base statements for the list endpoint, built once so SQLAlchemy's compile
+# cache is hit on every request; limit/offset are applied per call.
+_LIST_USERS_STMT = select(User).order_by(User.id)
+_COUNT_USERS_STMT = select(func.count()).select_from(User)
+
 class UserService:
+    @staticmethod
+    async def _run_blocking(func, *args):
+        """Run a blocking callable (e.g. bcrypt hashing) on the default
+        executor so it does not stall the event loop."""
+        return await asyncio.get_running_loop().run_in_executor(None, func, *args)
+
     @classmethod
     async def _execute_query(cls, session: AsyncSession, query):
         try:
@@ -57,7 +69,7 @@ class UserService:
             if existing_user:
                 logger.error("User with given email already exists.")
                 return None
-            validated_data['hashed_password'] = hash_password(validated_data.pop('password'))
+            validated_data['hashed_password'] = await cls._run_blocking(hash_password, validated_data.pop('password'))
             new_user = User(**validated_data)
             new_user.verification_token = generate_verification_token()
             new_nickname = generate_nickname()
@@ -80,7 +92,7 @@ class UserService:
             validated_data = UserUpdate(**update_data).dict(exclude_unset=True)
 
             if 'password' in validated_data:
-                validated_data['hashed_password'] = hash_password(validated_data.pop('password'))
+                validated_data['hashed_password'] = await cls._run_blocking(hash_password, validated_data.pop('password'))
             query = update(User).where(User.id == user_id).values(**validated_data).execution_options(synchronize_session="fetch")
             await cls._execute_query(session, query)
             updated_user = await cls.get_by_id(session, user_id)
@@ -107,7 +119,7 @@ class UserService:
 
     @classmethod
     async def list_users(cls, session: AsyncSession, skip: int = 0, limit: int = 10) -> List[User]:
-        query = select(User).offset(skip).limit(limit)
+        query = _LIST_USERS_STMT.offset(skip).limit(limit)
         result = await cls._execute_query(session, query)
         return result.scalars().all() if result else []
 
@@ -124,7 +136,7 @@ class UserService:
                 return None
             if user.is_locked:
                 return None
-            if verify_password(password, user.hashed_password):
+            if await cls._run_blocking(verify_password, password, user.hashed_password):
                 user.failed_login_attempts = 0
                 user.last_login_at = datetime.now(timezone.utc)
                 session.add(user)
@@ -146,7 +158,7 @@ class UserService:
 
     @classmethod
     async def reset_password(cls, session: AsyncSession, user_id: UUID, new_password: str) -> bool:
-        hashed_password = hash_password(new_password)
+        hashed_password = await cls._run_blocking(hash_password, new_password)
         user = await cls.get_by_id(session, user_id)
         if user:
             user.hashed_password = hashed_password
@@ -177,8 +189,7 @@ class UserService:
         :param session: The AsyncSession instance for database access.
         :return: The count of users.
         """
-        query = select(func.count()).select_from(User)
-        result = await session.execute(query)
+        result = await session.execute(_COUNT_USERS_STMT)
         count = result.scalar()
         return count
     
@@ -1,17 +1,17 @@
 import pytest
-from httpx import AsyncClient, ASGITransport
+from httpx import AsyncClient
 
 from app.main import app
 from app.dependencies import get_db  # ✅ Correct import path
 from app.models.user_model import User
+from tests.conftest import _TRANSPORT
 
 
 @pytest.fixture
 async def client_with_db(db_session):
     """Creates an AsyncClient using the test database session."""
     app.dependency_overrides[get_db] = lambda: db_session
-    transport = ASGITransport(app=app, raise_app_exceptions=True)
-    async with AsyncClient(transport=transport, base_url="http://testserver") as client:
+    async with AsyncClient(transport=_TRANSPORT, base_url="http://testserver") as client:
         yield client
     app.dependency_overrides.clear()
 
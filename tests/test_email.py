@@ -1,10 +1,10 @@
-import pytest
-from unittest.mock import AsyncMock
+from unittest.mock import MagicMock
 
-@pytest.mark.asyncio
-async def test_send_markdown_email():
-    # Mock the email service method
-    mock_email_service = AsyncMock()
+
+def test_send_markdown_email():
+    # Mock the email service method; the assertion is purely about the call
+    # shape, so a sync test avoids spinning up an event loop.
+    mock_email_service = MagicMock()
     mock_email_service.send_user_email.return_value = True
 
     user_data = {
@@ -13,6 +13,6 @@ async def test_send_markdown_email():
         "verification_url": "http://example.com/verify?token=abc123"
     }
 
-    result = await mock_email_service.send_user_email(user_data, 'email_verification')
+    result = mock_email_service.send_user_email(user_data, 'email_verification')
     assert result is True
-    mock_email_service.send_user_email.assert_awaited_once_with(user_data, 'email_verification')
+    mock_email_service.send_user_email.assert_called_once_with(user_data, 'email_verification')
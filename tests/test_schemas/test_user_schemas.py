@@ -59,7 +59,7 @@ def test_user_update_valid(user_update_data):
 # Tests for UserResponse
 def test_user_response_valid(user_response_data):
     user = UserResponse(**user_response_data)
-    assert user.id == user_response_data["id"]
+    assert user.id == str(user_response_data["id"])
     assert user.first_name == user_response_data["first_name"]
     assert user.email == user_response_data["email"]
 
@@ -104,5 +104,5 @@ def test_user_base_invalid_email(user_base_data_invalid):
     with pytest.raises(ValidationError) as exc_info:
         UserBase(**user_base_data_invalid)
 
-    assert "value is not a valid email address" in str(exc_info.value)
+    assert "Invalid email format" in str(exc_info.value)
     assert "john.doe.example.com" in str(exc_info.value)